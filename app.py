@@ -1,12 +1,15 @@
 # File: app.py (Main Streamlit application)
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
+from datetime import date, datetime, timedelta
 import matplotlib.dates as mdates
-from collections import defaultdict
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
 import numpy as np
 from io import BytesIO
+import functools
+import zlib
 
 # Set page config
 st.set_page_config(
@@ -16,17 +19,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@functools.lru_cache(maxsize=512)
 def get_team_color(team_name):
     """Get color for a team, generate random color for new teams"""
     if team_name in TEAM_COLORS:
         return TEAM_COLORS[team_name]
     else:
-        # Generate a consistent color based on team name hash
-        import hashlib
-        hash_object = hashlib.md5(team_name.encode())
-        hex_dig = hash_object.hexdigest()
-        # Use the first 6 characters to create a color
-        return f"#{hex_dig[:6]}"
+        # Generate a consistent color based on team name checksum
+        # Use the low 24 bits to create a color
+        return f"#{zlib.crc32(team_name.encode()) & 0xFFFFFF:06x}"
 TEAM_COLORS = {
     "A-Team": "#FF6B6B",        # Red
     "Ninjas": "#4ECDC4",        # Teal
@@ -40,24 +41,99 @@ TEAM_COLORS = {
     "Wizards": "#B4F8C8"        # Light Green
 }
 
+# Team colors that always get black text
+LIGHT_COLORS_UPPER = frozenset(c.upper() for c in ['#FFEAA7', '#96CEB4', '#B4F8C8', '#DDA0DD', '#C7CEEA'])
+
+def _pick_text_color(color):
+    """Pick black or white text for readability on the given bar color"""
+    if color.upper() in LIGHT_COLORS_UPPER:
+        return 'black'
+
+    # Check if color is light using RGB values
+    hex_color = color.lstrip('#')
+    if len(hex_color) == 6:
+        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        # Calculate brightness using relative luminance
+        brightness = (r * 0.299 + g * 0.587 + b * 0.114)
+        return 'black' if brightness > 127 else 'white'
+    return 'white'
+
+# Text colors for the predefined teams, resolved once at import time
+TEAM_TEXT_COLOR = {team: _pick_text_color(color) for team, color in TEAM_COLORS.items()}
+
+TASK_COLUMNS = ['Task Name', 'Start Date', 'End Date', 'Team']
+
+def make_tasks(names=(), starts=(), ends=(), teams=()):
+    """Build the task store: one NumPy array per column, keyed by column name"""
+    return {
+        'Task Name': np.asarray(names, dtype=str),
+        'Start Date': np.asarray(starts, dtype='datetime64[D]'),
+        'End Date': np.asarray(ends, dtype='datetime64[D]'),
+        'Team': np.asarray(teams, dtype=str),
+    }
+
+def tasks_from_records(records):
+    """Build the task store from a list of task dicts"""
+    return make_tasks(*([record[col] for record in records] for col in TASK_COLUMNS))
+
+def append_task(tasks, task):
+    """Return a new task store with a single task dict appended"""
+    new_task = tasks_from_records([task])
+    return {col: np.concatenate([tasks[col], new_task[col]]) for col in TASK_COLUMNS}
+
+def has_tasks(tasks):
+    """Check whether the task store holds any tasks"""
+    return len(tasks['Task Name']) > 0
+
+def tasks_to_dataframe(tasks):
+    """Build a DataFrame of the tasks for display and CSV export"""
+    return pd.DataFrame({
+        'Task Name': tasks['Task Name'],
+        'Start Date': np.datetime_as_string(tasks['Start Date'], unit='D'),
+        'End Date': np.datetime_as_string(tasks['End Date'], unit='D'),
+        'Team': tasks['Team'],
+    })
+
 def create_timeline_plot(tasks_data, figure_width=18, figure_height=12):
     """Create the enhanced timeline plot with better date visibility"""
     
-    # Group tasks by team for y-axis arrangement
-    team_tasks = defaultdict(list)
-    for _, row in tasks_data.iterrows():
-        start_dt = pd.to_datetime(row['Start Date']).to_pydatetime()
-        end_dt = pd.to_datetime(row['End Date']).to_pydatetime()
-        team_tasks[row['Team']].append((row['Task Name'], start_dt, end_dt))
-
-    teams = list(team_tasks.keys())
+    # Work straight off the task store columns
+    names = tasks_data['Task Name']
+    durations = (tasks_data['End Date'] - tasks_data['Start Date']).astype(np.int64)
+    starts = tasks_data['Start Date'].astype('datetime64[us]').astype(object)
+    ends = tasks_data['End Date'].astype('datetime64[us]').astype(object)
+    team_names = tasks_data['Team']
+
+    # Truncate task names and pick font sizes based on the available bar width
+    is_short, is_medium = durations < 3, durations < 5
+    font_sizes = np.select([is_short, is_medium], [7, 8], default=9)
+    max_name_lens = np.select([is_short, is_medium], [8, 15], default=30)
+    truncated_names = np.where(
+        is_short, np.char.add(names.astype('<U8'), "..."),
+        np.where(is_medium, np.char.add(names.astype('<U15'), "..."),
+                 np.char.add(names.astype('<U30'), "..."))
+    )
+    display_names = np.where(np.char.str_len(names) > max_name_lens, truncated_names, names)
+
+    # Group tasks by team for y-axis arrangement: a stable sort makes each team's tasks
+    # a contiguous slice in input order, and teams keep the order they first appear in
+    order = np.argsort(team_names, kind='stable')
+    group_teams, group_starts = np.unique(team_names[order], return_index=True)
+    group_ends = np.append(group_starts[1:], len(order))
+    first_seen = np.argsort(order[group_starts])
+    teams = group_teams[first_seen].tolist()
+    team_rows = [slice(a, b) for a, b in zip(group_starts[first_seen], group_ends[first_seen])]
+
+    display_names, starts, ends = display_names[order], starts[order], ends[order]
+    durations, font_sizes = durations[order], font_sizes[order]
     
     if not teams:
         return None
 
-    # Create enhanced plot
-    plt.style.use('default')
-    fig, ax = plt.subplots(figsize=(figure_width, figure_height))
+    # Create enhanced plot on a standalone Agg figure, bypassing pyplot's global figure registry
+    fig = Figure(figsize=(figure_width, figure_height))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
 
     # Set background color
     fig.patch.set_facecolor('white')
@@ -67,52 +143,33 @@ def create_timeline_plot(tasks_data, figure_width=18, figure_height=12):
     ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5, color='gray')
     ax.set_axisbelow(True)
 
+    # Bar geometry is collected across all tasks and drawn with a single barh call
+    bar_ys, bar_widths, bar_lefts, bar_colors = [], [], [], []
+    milestone_x, milestone_y = [], []
+
+    # Colors only depend on the team, so resolve them once up front
+    team_color = {t: get_team_color(t) for t in teams}
+    team_text_color = {t: TEAM_TEXT_COLOR.get(t) or _pick_text_color(team_color[t]) for t in teams}
+
     # Plot each team's tasks with enhanced styling and better date visibility
-    for i, team in enumerate(teams):
+    for i, (team, rows) in enumerate(zip(teams, team_rows)):
         y_base = i
-        color = get_team_color(team)
+        color = team_color[team]
+        text_color = team_text_color[team]
 
-        for idx, (name, start, end) in enumerate(team_tasks[team]):
+        team_tasks = zip(display_names[rows], starts[rows], ends[rows], durations[rows], font_sizes[rows])
+        for idx, (display_name, start, end, duration, font_size) in enumerate(team_tasks):
             y_offset = y_base + (idx * 0.3)
-            duration = (end - start).days
-            bar_height = 0.25
 
-            # Draw the task bar
-            ax.barh(y_offset, duration, left=start, height=bar_height,
-                   color=color, alpha=0.8, edgecolor='white', linewidth=2)
+            # Queue the task bar
+            bar_ys.append(y_offset)
+            bar_widths.append(duration)
+            bar_lefts.append(start)
+            bar_colors.append(color)
 
             # Calculate text positioning
             mid_point = start + (end - start) / 2
 
-            # Determine optimal text placement and size based on bar width
-            bar_width_days = duration
-
-            # Truncate task names based on available space
-            if bar_width_days < 3:
-                display_name = name[:8] + "..." if len(name) > 8 else name
-                font_size = 7
-            elif bar_width_days < 5:
-                display_name = name[:15] + "..." if len(name) > 15 else name
-                font_size = 8
-            else:
-                display_name = name[:30] + "..." if len(name) > 30 else name
-                font_size = 9
-
-            # Text color selection
-            light_colors = ['#FFEAA7', '#96CEB4', '#B4F8C8', '#DDA0DD', '#C7CEEA']
-            if any(color.upper() == light_color.upper() for light_color in light_colors):
-                text_color = 'black'
-            else:
-                # Check if color is light using RGB values
-                hex_color = color.lstrip('#')
-                if len(hex_color) == 6:
-                    r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-                    # Calculate brightness using relative luminance
-                    brightness = (r * 0.299 + g * 0.587 + b * 0.114)
-                    text_color = 'black' if brightness > 127 else 'white'
-                else:
-                    text_color = 'white'
-
             # Position task name on the bar
             ax.text(mid_point, y_offset, display_name,
                    ha='center', va='center', fontsize=font_size, fontweight='bold',
@@ -123,7 +180,7 @@ def create_timeline_plot(tasks_data, figure_width=18, figure_height=12):
             ax.text(start - timedelta(days=0.5), y_offset, start_date_str,
                    ha='right', va='center', fontsize=8, fontweight='bold',
                    color='darkblue',
-                   bbox=dict(boxstyle="round,pad=0.2", facecolor='lightcyan',
+                   bbox=dict(boxstyle="square,pad=0.15", facecolor='lightcyan',
                             edgecolor='darkblue', linewidth=1, alpha=0.9))
 
             # Add end date at the end of the bar
@@ -131,7 +188,7 @@ def create_timeline_plot(tasks_data, figure_width=18, figure_height=12):
             ax.text(end + timedelta(days=0.5), y_offset, end_date_str,
                    ha='left', va='center', fontsize=8, fontweight='bold',
                    color='darkred',
-                   bbox=dict(boxstyle="round,pad=0.2", facecolor='mistyrose',
+                   bbox=dict(boxstyle="square,pad=0.15", facecolor='mistyrose',
                             edgecolor='darkred', linewidth=1, alpha=0.9))
 
             # Add duration indicator
@@ -142,12 +199,21 @@ def create_timeline_plot(tasks_data, figure_width=18, figure_height=12):
 
             # Add milestone markers for single-day tasks
             if duration == 0:
-                ax.plot(start, y_offset, marker='D', markersize=12, 
-                       color='red', markeredgecolor='darkred', markeredgewidth=2,
-                       zorder=15)
+                milestone_x.append(start)
+                milestone_y.append(y_offset)
+
+    # Draw all task bars at once; bars are rasterized while text stays vector
+    ax.barh(bar_ys, bar_widths, left=bar_lefts, height=0.25,
+           color=bar_colors, alpha=0.8, edgecolor='white', linewidth=2,
+           rasterized=True)
+
+    # Draw all milestone markers at once
+    if milestone_x:
+        ax.scatter(milestone_x, milestone_y, marker='D', s=144, c='red',
+                  edgecolors='darkred', linewidths=2, zorder=15)
 
     # Y-axis setup
-    max_tasks_per_team = max(len(team_tasks[team]) for team in teams)
+    max_tasks_per_team = int((group_ends - group_starts).max())
     y_spacing = max(0.6, max_tasks_per_team * 0.3)
 
     ax.set_yticks(range(len(teams)))
@@ -158,11 +224,12 @@ def create_timeline_plot(tasks_data, figure_width=18, figure_height=12):
     ax.xaxis.set_major_locator(mdates.WeekdayLocator(byweekday=mdates.MO))
     ax.xaxis.set_minor_locator(mdates.DayLocator(interval=2))
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %d\n%Y"))
-    plt.xticks(rotation=45, ha='right', fontsize=10)
+    for label in ax.get_xticklabels():
+        label.set(rotation=45, ha='right', fontsize=10)
 
     # Add today's date marker
     today = datetime.now()
-    start_date = min(pd.to_datetime(tasks_data['Start Date']).min(), today)
+    start_date = min(starts.min(), today)
     if today >= start_date:
         ax.axvline(today, color='red', linestyle='--', linewidth=3, alpha=0.8, 
                    label=f'Today ({today.strftime("%m/%d/%Y")})', zorder=5)
@@ -177,33 +244,26 @@ def create_timeline_plot(tasks_data, figure_width=18, figure_height=12):
     ax3 = ax.twiny()
     ax3.set_xlim(ax.get_xlim())
 
-    start_date = pd.to_datetime(tasks_data['Start Date']).min().to_pydatetime()
-    end_date = pd.to_datetime(tasks_data['End Date']).max().to_pydatetime()
+    start_date = starts.min()
+    end_date = ends.max()
 
-    week_dates = []
-    current_date = start_date - timedelta(days=start_date.weekday())
-    while current_date <= end_date + timedelta(days=7):
-        week_dates.append(current_date)
-        current_date += timedelta(days=7)
+    # Mondays from the first task's week through one week past the last task
+    first_monday = pd.Timestamp(start_date) - pd.Timedelta(days=start_date.weekday())
+    week_dates = pd.date_range(first_monday, end_date + pd.Timedelta(days=7), freq='W-MON')
 
     ax3.set_xticks(week_dates)
-    week_labels = [f"Week {d.isocalendar()[1]}" for d in week_dates]
+    week_labels = [f"Week {w}" for w in week_dates.isocalendar().week.to_numpy()]
     ax3.set_xticklabels(week_labels, fontsize=10, fontweight='bold')
     ax3.set_xlabel("Calendar Weeks", fontsize=12, fontweight='bold', labelpad=15)
 
     # Legend
-    legend_elements = []
-    legend_labels = []
-
-    for team in teams:
-        color = get_team_color(team)
-        legend_elements.append(plt.Rectangle((0,0),1,1, facecolor=color, alpha=0.8, 
-                                           edgecolor='black', linewidth=1))
-        legend_labels.append(team)
+    legend_elements = [Patch(facecolor=team_color[team], alpha=0.8, edgecolor='black', linewidth=1)
+                       for team in teams]
+    legend_labels = list(teams)
 
     legend_elements.extend([
-        plt.Rectangle((0,0),1,1, facecolor='lightcyan', edgecolor='darkblue', linewidth=1),
-        plt.Rectangle((0,0),1,1, facecolor='mistyrose', edgecolor='darkred', linewidth=1)
+        Patch(facecolor='lightcyan', edgecolor='darkblue', linewidth=1),
+        Patch(facecolor='mistyrose', edgecolor='darkred', linewidth=1)
     ])
     legend_labels.extend(['Start Date', 'End Date'])
 
@@ -211,16 +271,59 @@ def create_timeline_plot(tasks_data, figure_width=18, figure_height=12):
              bbox_to_anchor=(0.98, 0.02), ncol=2, frameon=True, fancybox=True,
              shadow=True, facecolor='white', edgecolor='black', fontsize=10)
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_timeline_cached(tasks, figure_width, figure_height, dpi, render_date):
+    """Render the timeline to PNG bytes, cached on the task arrays, figure settings and
+    render_date (the day the Today marker is drawn for, so entries roll over at midnight)"""
+    fig = create_timeline_plot(tasks, figure_width, figure_height)
+    if fig is None:
+        return None
+
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight',
+               facecolor='white', edgecolor='none', metadata={'Software': None})
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False)
+def _team_sidebar_html(team_rows):
+    """Render the sidebar team list from (team, task count) rows as a single HTML blob"""
+    html_parts = []
+    for team, task_count in team_rows:
+        team_color = get_team_color(team)
+        task_info = f" ({task_count} tasks)" if task_count > 0 else " (no tasks yet)"
+        html_parts.append(
+            f"<div style='display:flex; align-items:center; margin:2px 0;'>"
+            f"<span style='display:inline-block; width:12px; height:12px; "
+            f"background-color:{team_color}; border-radius:2px; margin-right:8px;'></span>"
+            f"<span style='font-size:14px;'>{team}{task_info}</span></div>"
+        )
+    return "".join(html_parts)
+
+@st.cache_data(show_spinner=False)
+def _team_summary_markdown(team_counts):
+    """Render the Team Summary panel from (team, task count) rows as a single markdown blob"""
+    html_lines = [
+        f"<span style='display:inline-block; width:12px; height:12px; "
+        f"background-color:{get_team_color(team)}; border-radius:2px; margin-right:5px;'></span>"
+        f"**{team}**: {count} task{'s' if count != 1 else ''}"
+        for team, count in team_counts
+    ]
+    # Blank lines keep one paragraph per team, as separate st.markdown calls did
+    return "\n\n".join(html_lines)
+
 def main():
     st.title("📅 Project Timeline Generator")
     st.markdown("Create professional project timelines with team assignments and date visibility")
 
     # Initialize session state for tasks FIRST
     if 'tasks' not in st.session_state:
-        st.session_state.tasks = []
+        st.session_state.tasks = make_tasks()
+    # Bumped on every task mutation so the timeline is only re-rendered when tasks change
+    if 'tasks_version' not in st.session_state:
+        st.session_state.tasks_version = 0
 
     # Sidebar for inputs
     with st.sidebar:
@@ -241,7 +344,7 @@ def main():
             if st.button("Add Team", key="add_team_btn"):
                 if new_team_name and new_team_name.strip():
                     # Check if team already exists
-                    existing_teams = list(set([task["Team"] for task in st.session_state.tasks]))
+                    existing_teams = pd.unique(st.session_state.tasks["Team"]).tolist()
                     all_available_teams = list(TEAM_COLORS.keys()) + existing_teams
                     
                     if new_team_name.strip() not in all_available_teams:
@@ -262,25 +365,18 @@ def main():
                     st.error("Please enter a team name!")
         
         # Display current teams
-        if st.session_state.tasks or st.session_state.get('custom_teams', []):
-            active_teams = list(set([task["Team"] for task in st.session_state.tasks]))
+        if has_tasks(st.session_state.tasks) or st.session_state.get('custom_teams', []):
+            active_teams = pd.unique(st.session_state.tasks["Team"]).tolist()
             custom_teams = st.session_state.get('custom_teams', [])
-            all_teams = list(set(active_teams + custom_teams))
+            all_teams = list(dict.fromkeys(active_teams + custom_teams))
             
             st.write(f"**Available Teams ({len(all_teams)}):**")
-            for team in sorted(all_teams):
-                team_color = get_team_color(team)
-                # Show task count for active teams
-                task_count = len([task for task in st.session_state.tasks if task["Team"] == team])
-                task_info = f" ({task_count} tasks)" if task_count > 0 else " (no tasks yet)"
-                
-                st.markdown(
-                    f"<div style='display:flex; align-items:center; margin:2px 0;'>"
-                    f"<span style='display:inline-block; width:12px; height:12px; "
-                    f"background-color:{team_color}; border-radius:2px; margin-right:8px;'></span>"
-                    f"<span style='font-size:14px;'>{team}{task_info}</span></div>",
-                    unsafe_allow_html=True
-                )
+            # Show task count for active teams
+            team_rows = tuple(
+                (team, int(np.count_nonzero(st.session_state.tasks["Team"] == team)))
+                for team in sorted(all_teams)
+            )
+            st.markdown(_team_sidebar_html(team_rows), unsafe_allow_html=True)
                 
             # Option to remove custom teams that have no tasks
             unused_custom_teams = [team for team in st.session_state.get('custom_teams', []) 
@@ -307,8 +403,17 @@ def main():
         
         # Plot dimensions
         st.subheader("📊 Plot Settings")
-        figure_width = st.slider("Figure Width", 12, 24, 18)
-        figure_height = st.slider("Figure Height", 8, 16, 12)
+        # Settings live in a form so dragging a slider doesn't rebuild the plot on every step
+        with st.form("plot_settings_form"):
+            figure_width = st.slider("Figure Width", 12, 24, 18)
+            figure_height = st.slider("Figure Height", 8, 16, 12)
+            export_dpi = st.selectbox(
+                "Export DPI",
+                options=[100, 150, 300],
+                index=1,
+                help="Resolution of the rendered timeline image; 300 is print quality but slower"
+            )
+            st.form_submit_button("🔄 Regenerate Timeline")
         
         st.markdown("---")
         
@@ -325,14 +430,15 @@ def main():
         # Sample data loading (moved here after session state initialization)
         # Load sample data if requested
         if 'sample_loaded' in st.session_state and st.session_state.sample_loaded:
-            st.session_state.tasks = [
+            st.session_state.tasks = tasks_from_records([
                 {"Task Name": "OASIS S.Verif. Endpoint", "Start Date": "2025-07-21", "End Date": "2025-09-03", "Team": "A-Team"},
                 {"Task Name": "TVS RAS integration under CPS-2684", "Start Date": "2025-08-18", "End Date": "2025-09-05", "Team": "Ninjas"},
                 {"Task Name": "RAS integration", "Start Date": "2025-08-12", "End Date": "2025-09-03", "Team": "Challengers"},
                 {"Task Name": "Games Oasis Related Messages", "Start Date": "2025-08-25", "End Date": "2025-08-29", "Team": "5G"},
                 {"Task Name": "E2E & PLAB testing", "Start Date": "2025-09-08", "End Date": "2025-09-15", "Team": "All Teams"},
                 {"Task Name": "Release", "Start Date": "2025-09-15", "End Date": "2025-09-15", "Team": "All Teams"},
-            ]
+            ])
+            st.session_state.tasks_version += 1
             st.session_state.sample_loaded = False
             st.rerun()
         
@@ -346,10 +452,9 @@ def main():
                 task_name = st.text_input("Task Name", placeholder="Enter task name...")
             with col_team:
                 # Get existing teams from current tasks
-                existing_teams = list(set([task.get("Team", "") for task in st.session_state.tasks if task.get("Team")]))
-                available_teams = list(TEAM_COLORS.keys()) + [team for team in existing_teams if team not in TEAM_COLORS.keys()]
-                # Remove duplicates while preserving order
-                available_teams = list(dict.fromkeys(available_teams))
+                existing_teams = st.session_state.tasks["Team"][st.session_state.tasks["Team"] != ""]
+                # Predefined teams first, then task teams in first-seen order, without duplicates
+                available_teams = pd.unique(np.concatenate([list(TEAM_COLORS), existing_teams])).tolist()
                 
                 # Team selection with custom input option
                 team_option = st.radio(
@@ -401,7 +506,8 @@ def main():
                         "End Date": end_date.strftime("%Y-%m-%d"),
                         "Team": team.strip()
                     }
-                    st.session_state.tasks.append(new_task)
+                    st.session_state.tasks = append_task(st.session_state.tasks, new_task)
+                    st.session_state.tasks_version += 1
                     st.success(f"Task '{task_name}' added successfully to team '{team}'!")
                     st.rerun()
                 else:
@@ -412,21 +518,14 @@ def main():
     with col2:
         st.subheader("📊 Current Tasks")
         
-        if st.session_state.tasks:
+        if has_tasks(st.session_state.tasks):
             # Display current tasks with team management
-            df = pd.DataFrame(st.session_state.tasks)
+            df = tasks_to_dataframe(st.session_state.tasks)
             
             # Show team summary
             team_counts = df['Team'].value_counts()
             st.write("**Team Summary:**")
-            for team, count in team_counts.items():
-                team_color = get_team_color(team)
-                st.markdown(
-                    f"<span style='display:inline-block; width:12px; height:12px; "
-                    f"background-color:{team_color}; border-radius:2px; margin-right:5px;'></span>"
-                    f"**{team}**: {count} task{'s' if count != 1 else ''}",
-                    unsafe_allow_html=True
-                )
+            st.markdown(_team_summary_markdown(tuple(team_counts.items())), unsafe_allow_html=True)
             
             st.markdown("---")
             st.dataframe(df, use_container_width=True, hide_index=True)
@@ -435,7 +534,8 @@ def main():
             col_clear, col_download = st.columns(2)
             with col_clear:
                 if st.button("🗑️ Clear All", type="secondary"):
-                    st.session_state.tasks = []
+                    st.session_state.tasks = make_tasks()
+                    st.session_state.tasks_version += 1
                     st.rerun()
             
             with col_download:
@@ -461,53 +561,65 @@ def main():
     
     if uploaded_file is not None:
         try:
-            uploaded_df = pd.read_csv(uploaded_file)
             required_columns = ['Task Name', 'Start Date', 'End Date', 'Team']
+            uploaded_df = pd.read_csv(
+                uploaded_file,
+                usecols=lambda col: col in required_columns,
+                dtype={'Task Name': 'string', 'Team': 'string'}
+            )
             
-            if all(col in uploaded_df.columns for col in required_columns):
+            if not all(col in uploaded_df.columns for col in required_columns):
+                st.error(f"CSV must contain these columns: {required_columns}")
+            elif uploaded_df[required_columns].isna().any().any():
+                # Reject empty cells rather than letting them turn into "<NA>" text in the task store
+                has_empty = uploaded_df[required_columns].isna().any()
+                st.error(f"CSV has empty cells in these columns: {has_empty[has_empty].index.tolist()}")
+            else:
                 # Validate dates
                 try:
-                    pd.to_datetime(uploaded_df['Start Date'])
-                    pd.to_datetime(uploaded_df['End Date'])
+                    start_dates = pd.to_datetime(uploaded_df['Start Date'])
+                    end_dates = pd.to_datetime(uploaded_df['End Date'])
                     
-                    st.session_state.tasks = uploaded_df.to_dict('records')
+                    st.session_state.tasks = make_tasks(
+                        uploaded_df['Task Name'], start_dates, end_dates, uploaded_df['Team']
+                    )
+                    st.session_state.tasks_version += 1
                     st.success(f"Successfully loaded {len(uploaded_df)} tasks from CSV!")
                     st.rerun()
                 except:
                     st.error("Invalid date format in CSV. Please use YYYY-MM-DD format.")
-            else:
-                st.error(f"CSV must contain these columns: {required_columns}")
         except Exception as e:
             st.error(f"Error reading CSV file: {str(e)}")
 
     # Generate timeline
-    if st.session_state.tasks:
+    if has_tasks(st.session_state.tasks):
         st.markdown("---")
         st.subheader("📈 Generated Timeline")
         
-        # Create DataFrame from tasks
-        tasks_df = pd.DataFrame(st.session_state.tasks)
-        
         # Generate plot
         with st.spinner("Generating timeline..."):
-            fig = create_timeline_plot(tasks_df, figure_width, figure_height)
+            # Reuse this session's last render unless tasks or plot settings changed
+            render_date = date.today()
+            render_key = (st.session_state.tasks_version, figure_width, figure_height, export_dpi, render_date)
+            last_render = st.session_state.get('last_render')
+            if last_render is not None and last_render[0] == render_key:
+                png_bytes = last_render[1]
+            else:
+                png_bytes = _build_timeline_cached(
+                    st.session_state.tasks, figure_width, figure_height, export_dpi, render_date
+                )
+                st.session_state.last_render = (render_key, png_bytes)
             
-            if fig:
-                st.pyplot(fig)
+            if png_bytes:
+                st.image(png_bytes)
                 
                 # Download plot
-                buffer = BytesIO()
-                fig.savefig(buffer, format='png', dpi=300, bbox_inches='tight',
-                           facecolor='white', edgecolor='none')
-                buffer.seek(0)
-                
                 st.download_button(
                     label="📥 Download Timeline (PNG)",
-                    data=buffer.getvalue(),
+                    data=png_bytes,
                     file_name="project_timeline.png",
                     mime="image/png"
                 )
-                plt.close(fig)  # Close figure to free memory
             else:
                 st.error("Unable to generate timeline. Please check your data.")
     